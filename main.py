@@ -1,39 +1,100 @@
 import streamlit as st
-import json
+import html
 import os
+import threading
 from datetime import datetime
+from collections import defaultdict
+from contextlib import contextmanager
 import random
-import hashlib
-import hmac
-import base64 
-import plotly.express as px
-import pandas as pd
+import itertools
 import time
+import hashlib
+import ssl
+import numpy as np
+import orjson
 
 # Constants
 DATA_FILE = "todo_data.json"
-LIST_EMOJIS = ["📋", "📝", "✅", "📌", "🗒️", "✏️", "📅", "📊"]
-TASK_EMOJIS = ["•", "→", "⇒", "⦿", "○", "▪", "▫", "‣"]
+DEBUG = os.environ.get("TODO_APP_DEBUG") == "1"  # pretty-print the data file
+DURABLE_WRITES = os.environ.get("TODO_APP_DURABLE") == "1"  # O_DSYNC on every save
+# 8 entries each, so random.getrandbits(3) picks one uniformly
+LIST_EMOJIS = ("📋", "📝", "✅", "📌", "🗒️", "✏️", "📅", "📊")
+TASK_EMOJIS = ("•", "→", "⇒", "⦿", "○", "▪", "▫", "‣")
+PRIORITIES = ["Low", "Medium", "High"]  # index is the stored priority code
+MOTIVATIONAL_QUOTES = (
+    "Productivity is doing what needs to be done when it needs to be done.",
+    "Small daily improvements lead to stunning results.",
+    "The way to get started is to quit talking and begin doing.",
+    "Your time is limited, don't waste it living someone else's life.",
+    "The secret of getting ahead is getting started."
+)
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Password hashing
+_PBKDF2_ITERS = 200_000
+_LEGACY_PBKDF2_ITERS = 100_000  # hashes stored before the algorithm tag was added
+_SCRYPT_N = 2 ** 14
+_SCRYPT_R = 8
+_SCRYPT_P = 1
+
+if "sha256" not in hashlib.algorithms_guaranteed:
+    raise RuntimeError("hashlib does not provide sha256")
+
+# scrypt (and OpenSSL's accelerated SHA-256) need OpenSSL 1.1.1+, else fall back to PBKDF2
+_PASSWORD_ALGORITHM = (
+    "scrypt" if hasattr(hashlib, "scrypt") and ssl.OPENSSL_VERSION_INFO >= (1, 1, 1)
+    else "pbkdf2_sha256"
+)
+
+def _kdf(algorithm, cost, salt, password):
+    """Derive a key with the given algorithm and cost"""
+    if algorithm == "scrypt":
+        return hashlib.scrypt(password, salt=salt, n=cost, r=_SCRYPT_R, p=_SCRYPT_P, dklen=32)
+    return hashlib.pbkdf2_hmac('sha256', password, salt, cost)
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _derive(algorithm, cost, salt, password):
+    """Derive a key, cached across reruns so repeated logins skip the KDF.
+
+    Only for verifying stored hashes; hashing a new password uses a fresh
+    salt that never repeats, so it calls _kdf directly rather than filling
+    the cache with entries that would never be hit.
+    """
+    return _kdf(algorithm, cost, salt, password)
 
 def hash_password(password):
     """Hash a password for storing."""
+    import base64
+    algorithm = _PASSWORD_ALGORITHM
+    cost = _SCRYPT_N if algorithm == "scrypt" else _PBKDF2_ITERS
     salt = os.urandom(32)
-    key = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, 100000)
+    # A fresh salt never repeats, so skip the login cache
+    key = _kdf(algorithm, cost, salt, password.encode('utf-8'))
     return {
+        'algorithm': algorithm,
+        'cost': cost,
         'salt': base64.b64encode(salt).decode('utf-8'),
         'key': base64.b64encode(key).decode('utf-8')
     }
 
 def verify_password(stored_password, provided_password):
     """Verify a stored password against one provided by user"""
+    import base64
+    import hmac
     try:
+        algorithm = stored_password.get('algorithm', 'pbkdf2_sha256')
+        cost = stored_password.get('cost', _LEGACY_PBKDF2_ITERS)
         salt = base64.b64decode(stored_password['salt'].encode('utf-8'))
         stored_key = base64.b64decode(stored_password['key'].encode('utf-8'))
-        key = hashlib.pbkdf2_hmac('sha256', provided_password.encode('utf-8'), salt, 100000)
+        key = _derive(algorithm, cost, salt, provided_password.encode('utf-8'))
         return hmac.compare_digest(key, stored_key)
     except:
         return False
 
+def timestamp():
+    """Current local time as a human-readable timestamp"""
+    return datetime.now().strftime(TIMESTAMP_FORMAT)
+
 def check_credentials(username, password):
     """Check if credentials are valid"""
     if username in st.session_state.users:
@@ -41,33 +102,143 @@ def check_credentials(username, password):
         return verify_password(stored_password, password)
     return False
 
+@st.cache_resource
+def get_data_file():
+    """Data file handle shared across reruns: descriptor, the file it points to, and a lock"""
+    return {"fd": None, "file_id": None, "lock": threading.Lock()}
+
+def _file_id(stat_result):
+    """Identify a file by device and inode"""
+    return stat_result.st_dev, stat_result.st_ino
+
+@contextmanager
+def data_file():
+    """Lock the data file and yield a descriptor for the file now at DATA_FILE.
+
+    git checkouts, backup restores and deletes replace the file instead of
+    editing it, so the descriptor is reopened when the inode changes.
+    """
+    handle = get_data_file()
+    with handle["lock"]:
+        try:
+            current_id = _file_id(os.stat(DATA_FILE))
+        except FileNotFoundError:
+            current_id = None
+        if handle["fd"] is None or handle["file_id"] != current_id:
+            if handle["fd"] is not None:
+                os.close(handle["fd"])
+                handle["fd"] = None
+            flags = os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0)
+            if DURABLE_WRITES:
+                flags |= getattr(os, "O_DSYNC", 0)
+            fd = os.open(DATA_FILE, flags, 0o600)
+            handle["fd"], handle["file_id"] = fd, _file_id(os.fstat(fd))
+        yield handle["fd"]
+
+def _read_file(fd):
+    """Read the whole file from offset 0"""
+    size = os.fstat(fd).st_size
+    if hasattr(os, "pread"):
+        return os.pread(fd, size, 0)
+    os.lseek(fd, 0, os.SEEK_SET)
+    return os.read(fd, size)
+
+def _rewrite_file(fd, data):
+    """Overwrite the file in place with data and cut off any old tail.
+
+    Shorter data is first padded with spaces to the old size, so a crash
+    before the truncate leaves valid JSON followed by whitespace.
+    """
+    size = len(data)
+    old_size = os.fstat(fd).st_size
+    if size < old_size:
+        data += b" " * (old_size - size)
+    view = memoryview(data)
+    offset = 0
+    while offset < len(view):
+        if hasattr(os, "pwrite"):
+            offset += os.pwrite(fd, view[offset:], offset)
+        else:
+            os.lseek(fd, offset, os.SEEK_SET)
+            offset += os.write(fd, view[offset:])
+    os.ftruncate(fd, size)
+
 def load_data():
     """Load all data from JSON file"""
-    if os.path.exists(DATA_FILE):
-        try:
-            with open(DATA_FILE, "r") as f:
-                return json.load(f)
-        except:
-            return {"lists": {}, "current_list": None, "users": {}}
+    try:
+        with data_file() as fd:
+            raw = _read_file(fd)
+        if raw.strip():
+            return orjson.loads(raw)
+    except Exception as e:
+        report_load_error(e)
     return {"lists": {}, "current_list": None, "users": {}}
 
+def report_load_error(error):
+    """Show that the data file is unreadable and block saves so it is not overwritten"""
+    # Starting empty would let the next save wipe the file
+    st.session_state.load_error = (
+        f"Error loading data: {error}. {DATA_FILE} will not be overwritten; "
+        "fix or remove it, then reload the app."
+    )
+
+def _without_derived(data):
+    """Drop underscore-prefixed fields, which are rebuilt on load"""
+    return {key: value for key, value in data.items() if not key.startswith("_")}
+
+def stored_lists():
+    """Lists as written to disk, without derived fields such as the id index"""
+    return {
+        list_id: {**_without_derived(list_data), "tasks": _without_derived(list_data["tasks"])}
+        for list_id, list_data in st.session_state.lists.items()
+    }
+
 def save_data():
     """Save all data to JSON file"""
+    if st.session_state.get("load_error"):
+        return
     try:
-        with open(DATA_FILE, "w") as f:
-            json.dump({
-                "lists": st.session_state.lists,
-                "current_list": st.session_state.current_list,
-                "users": st.session_state.users
-            }, f, indent=2)
+        payload = orjson.dumps({
+            "lists": stored_lists(),
+            "current_list": st.session_state.current_list,
+            "users": st.session_state.users
+        }, option=orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if DEBUG else 0))
+        payload_hash = hashlib.blake2b(payload, digest_size=16).digest()
+        if payload_hash == st.session_state.get("last_saved_hash"):
+            st.session_state.dirty = False
+            return
+        with data_file() as fd:
+            _rewrite_file(fd, payload)
+        st.session_state.last_saved_hash = payload_hash
+        st.session_state.dirty = False
     except Exception as e:
         st.error(f"Error saving data: {e}")
 
+def mark_dirty():
+    """Flag session data as changed so the next flush writes it"""
+    st.session_state.dirty = True
+
+def flush_data():
+    """Write data to disk once per script run, only if something changed"""
+    if st.session_state.get("dirty", False):
+        save_data()
+
 def initialize_state():
     """Initialize session state variables"""
     if "initialized" not in st.session_state:
+        st.session_state.load_error = None
         data = load_data()
         st.session_state.lists = data.get("lists", {})
+        try:
+            for list_data in st.session_state.lists.values():
+                list_data["tasks"] = load_tasks(list_data["tasks"])
+                # Counters written by older versions; they are rebuilt below
+                for key in ("total", "completed", "priority_counts"):
+                    list_data.pop(key, None)
+                rebuild_task_cache(list_data)
+        except ValueError as e:
+            report_load_error(e)
+            st.session_state.lists = {}
         st.session_state.current_list = data.get("current_list", next(iter(st.session_state.lists.keys()))) if st.session_state.lists else None
         st.session_state.users = data.get("users", {})
         st.session_state.authenticated = False
@@ -75,6 +246,12 @@ def initialize_state():
         st.session_state.auth_tab = "Login"
         st.session_state.initialized = True
         st.session_state.register_success = False
+        st.session_state.dirty = False
+        st.session_state.last_saved_hash = None
+        st.session_state.motivational_quote_idx = random.randrange(len(MOTIVATIONAL_QUOTES))
+        st.session_state.owner_index = defaultdict(list)
+        for list_id, list_data in st.session_state.lists.items():
+            st.session_state.owner_index[list_data.get("owner")].append(list_id)
     
     defaults = {
         "new_task": "",
@@ -84,141 +261,263 @@ def initialize_state():
         "show_pending": True,
         "priority_filter": "All",
         "delete_confirmation": None,
-        "reset_db_confirm": False
+        "reset_db_confirm": False,
+        "task_editor_rev": 0
     }
     
     for key, value in defaults.items():
         if key not in st.session_state:
             st.session_state[key] = value
 
+def empty_tasks():
+    """Create an empty columnar task store"""
+    return load_tasks({
+        "ids": [],
+        "texts": [],
+        "completed": [],
+        "priority": [],
+        "created_at": [],
+        "completed_at": [],
+        "emoji": []
+    })
+
+def load_tasks(tasks):
+    """Turn stored tasks into a columnar task store with numpy status/priority columns"""
+    if isinstance(tasks, list):
+        # One dict per task, as stored before the columnar layout
+        tasks = {
+            "ids": [task["id"] for task in tasks],
+            "texts": [task["text"] for task in tasks],
+            "completed": [task["completed"] for task in tasks],
+            "priority": [PRIORITIES.index(task["priority"]) for task in tasks],
+            "created_at": [task["created_at"] for task in tasks],
+            "completed_at": [task.get("completed_at") for task in tasks],
+            "emoji": [task["emoji"] for task in tasks]
+        }
+    tasks["completed"] = np.array(tasks["completed"], dtype=bool)
+    priority = np.array(tasks["priority"], dtype=np.int64)
+    # The count kernel indexes by priority code without bounds checks
+    invalid = (priority < 0) | (priority >= len(PRIORITIES))
+    if invalid.any():
+        raise ValueError(f"unknown priority code {priority[invalid][0]}")
+    tasks["priority"] = priority.astype(np.uint8)
+    tasks["_cards"] = [render_card(tasks, i) for i in range(len(tasks["ids"]))]
+    return tasks
+
+def render_card(tasks, i):
+    """Build the escaped HTML card for one task in its current state"""
+    priority = PRIORITIES[tasks["priority"][i]]
+    priority_class = f"priority-{priority.lower()}"
+    text = html.escape(tasks["texts"][i])
+    if tasks["completed"][i]:
+        return f"""<div class="{priority_class}">
+            <p class="task-completed">✅ {tasks['emoji'][i]} {text}
+            </p>
+            <p><small>Completed: {tasks['completed_at'][i] or 'Just now'} (Priority: {priority})</small></p>
+        </div>"""
+    return f"""<div class="{priority_class}">
+            <p class="task-pending">{tasks['emoji'][i]} {text}</p>
+            <p><small>Created: {tasks['created_at'][i]} (Priority: {priority})</small></p>
+        </div>"""
+
+def select_tasks(tasks, keep):
+    """Keep only the task rows selected by a boolean mask"""
+    rows = np.flatnonzero(keep).tolist()
+    for column, values in tasks.items():
+        tasks[column] = values[keep] if isinstance(values, np.ndarray) else [values[i] for i in rows]
+
+def rebuild_task_cache(list_data):
+    """Rebuild the cached task counters and id index of a list from its tasks"""
+    tasks = list_data["tasks"]
+    list_data["_id_index"] = {task_id: i for i, task_id in enumerate(tasks["ids"])}
+    list_data["_total"] = len(tasks["ids"])
+    list_data["_completed"] = int(tasks["completed"].sum())
+
+def _count_and_filter_loop(priority, completed, show_completed, show_pending, priority_filter):
+    """Visible-task mask and per-priority counts in a single pass (compiled with numba)"""
+    mask = np.zeros(priority.shape[0], dtype=np.bool_)
+    counts = np.zeros(3, dtype=np.int64)
+    for i in range(priority.shape[0]):
+        counts[priority[i]] += 1
+        shown = show_completed if completed[i] else show_pending
+        mask[i] = shown and (priority_filter < 0 or priority[i] == priority_filter)
+    return mask, counts
+
+def _count_and_filter_numpy(priority, completed, show_completed, show_pending, priority_filter):
+    """Visible-task mask and per-priority counts with plain numpy"""
+    mask = np.where(completed, show_completed, show_pending)
+    if priority_filter >= 0:
+        mask &= priority == priority_filter
+    return mask, np.bincount(priority, minlength=len(PRIORITIES))
+
+@st.cache_resource
+def get_count_and_filter():
+    """Count/filter kernel, compiled once per process when numba is installed"""
+    try:
+        import numba  # optional, see the "speed" extra in pyproject.toml
+    except ImportError:
+        return _count_and_filter_numpy
+    return numba.njit(cache=True)(_count_and_filter_loop)
+
+@st.cache_resource
+def get_id_counter():
+    """Process-wide counter that disambiguates ids created within the same clock tick"""
+    return itertools.count()
+
 def add_list():
     """Add a new list"""
     if st.session_state.new_list_name and st.session_state.new_list_name.strip():
-        list_id = f"list_{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
+        list_id = f"list_{time.time_ns()}_{next(get_id_counter())}"
         st.session_state.lists[list_id] = {
             "name": st.session_state.new_list_name.strip(),
-            "tasks": [],
-            "emoji": random.choice(LIST_EMOJIS),
-            "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "tasks": empty_tasks(),
+            "_total": 0,
+            "_completed": 0,
+            "_id_index": {},
+            "emoji": LIST_EMOJIS[random.getrandbits(3)],
+            "created_at": timestamp(),
             "owner": st.session_state.username
         }
+        st.session_state.owner_index[st.session_state.username].append(list_id)
         st.session_state.current_list = list_id
         st.session_state.new_list_name = ""
         st.session_state.delete_confirmation = None
-        save_data()
+        mark_dirty()
 
 def add_task():
     """Add a new task to current list"""
     if (st.session_state.new_task and st.session_state.new_task.strip() and 
         st.session_state.current_list):
-        task = {
-            "id": f"task_{datetime.now().strftime('%Y%m%d%H%M%S%f')}",
-            "text": st.session_state.new_task.strip(),
-            "completed": False,
-            "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "priority": st.session_state.new_task_priority,
-            "emoji": random.choice(TASK_EMOJIS)
-        }
-        st.session_state.lists[st.session_state.current_list]["tasks"].append(task)
+        priority = st.session_state.new_task_priority
+        list_data = st.session_state.lists[st.session_state.current_list]
+        tasks = list_data["tasks"]
+        task_id = f"task_{time.time_ns()}_{next(get_id_counter())}"
+        list_data["_id_index"][task_id] = len(tasks["ids"])
+        tasks["ids"].append(task_id)
+        tasks["texts"].append(st.session_state.new_task.strip())
+        tasks["completed"] = np.append(tasks["completed"], False)
+        tasks["priority"] = np.append(tasks["priority"], np.uint8(PRIORITIES.index(priority)))
+        tasks["created_at"].append(timestamp())
+        tasks["completed_at"].append(None)
+        tasks["emoji"].append(TASK_EMOJIS[random.getrandbits(3)])
+        tasks["_cards"].append(render_card(tasks, len(tasks["ids"]) - 1))
+        list_data["_total"] += 1
         st.session_state.new_task = ""
-        save_data()
+        mark_dirty()
 
 def toggle_task(list_id, task_id):
     """Toggle task completion status"""
     if list_id in st.session_state.lists:
-        for task in st.session_state.lists[list_id]["tasks"]:
-            if task["id"] == task_id:
-                task["completed"] = not task["completed"]
-                task["completed_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S") if task["completed"] else None
-                break
-        save_data()
-
-def delete_task(list_id, task_id):
-    """Delete a specific task"""
+        list_data = st.session_state.lists[list_id]
+        tasks = list_data["tasks"]
+        i = list_data["_id_index"].get(task_id)
+        if i is not None:
+            tasks["completed"][i] = ~tasks["completed"][i]
+            completed = bool(tasks["completed"][i])
+            tasks["completed_at"][i] = timestamp() if completed else None
+            tasks["_cards"][i] = render_card(tasks, i)
+            list_data["_completed"] += 1 if completed else -1
+            mark_dirty()
+
+def delete_tasks(list_id, task_ids):
+    """Delete a batch of tasks in one pass"""
     if list_id in st.session_state.lists:
-        st.session_state.lists[list_id]["tasks"] = [
-            task for task in st.session_state.lists[list_id]["tasks"]
-            if task["id"] != task_id
-        ]
-        save_data()
+        list_data = st.session_state.lists[list_id]
+        index = list_data["_id_index"]
+        rows = [index[task_id] for task_id in task_ids if task_id in index]
+        if rows:
+            keep = np.ones(len(list_data["tasks"]["ids"]), dtype=bool)
+            keep[rows] = False
+            select_tasks(list_data["tasks"], keep)
+            rebuild_task_cache(list_data)
+            mark_dirty()
 
 def clear_completed(list_id):
     """Remove all completed tasks from a list"""
     if list_id in st.session_state.lists:
-        st.session_state.lists[list_id]["tasks"] = [
-            task for task in st.session_state.lists[list_id]["tasks"]
-            if not task["completed"]
-        ]
-        save_data()
+        tasks = st.session_state.lists[list_id]["tasks"]
+        select_tasks(tasks, ~tasks["completed"])
+        rebuild_task_cache(st.session_state.lists[list_id])
+        mark_dirty()
 
 def delete_list(list_id):
     """Delete an entire list"""
     if list_id in st.session_state.lists:
-        del st.session_state.lists[list_id]
+        owner = st.session_state.lists.pop(list_id).get("owner")
+        st.session_state.owner_index[owner].remove(list_id)
         if st.session_state.current_list == list_id:
-            st.session_state.current_list = next(iter(st.session_state.lists.keys())) if st.session_state.lists else None
+            remaining = st.session_state.owner_index[owner]
+            st.session_state.current_list = remaining[0] if remaining else None
         st.session_state.delete_confirmation = None
-        save_data()
+        mark_dirty()
+
+def apply_task_edits(list_id, task_ids, completed):
+    """Apply all checkbox edits submitted from the task form in one pass"""
+    edits = st.session_state[f"task_editor_{st.session_state.task_editor_rev}"]["edited_rows"]
+    deleted = []
+    for row, changes in edits.items():
+        row = int(row)
+        if changes.get("Delete"):
+            deleted.append(task_ids[row])
+        elif changes.get("Done", completed[row]) != completed[row]:
+            toggle_task(list_id, task_ids[row])
+    delete_tasks(list_id, deleted)
+    # A fresh editor key drops the applied edits from widget state
+    st.session_state.task_editor_rev += 1
 
 def get_task_count(list_id):
     """Get task statistics for a list"""
     if list_id in st.session_state.lists:
-        tasks = st.session_state.lists[list_id]["tasks"]
-        total = len(tasks)
-        completed = sum(1 for task in tasks if task["completed"])
-        return total, completed
+        list_data = st.session_state.lists[list_id]
+        return list_data["_total"], list_data["_completed"]
     return 0, 0
 
-def create_priority_chart(list_id):
+@st.cache_data(max_entries=32, show_spinner=False)
+def create_priority_chart(high, medium, low):
     """Create a pie chart showing task priority distribution"""
-    if list_id in st.session_state.lists:
-        tasks = st.session_state.lists[list_id]["tasks"]
-        if not tasks:
-            return None
-            
-        priorities = {"High": 0, "Medium": 0, "Low": 0}
-        for task in tasks:
-            priorities[task["priority"]] += 1
-            
-        df = pd.DataFrame({
-            "Priority": ["High", "Medium", "Low"],
-            "Count": [priorities["High"], priorities["Medium"], priorities["Low"]],
-            "Color": ["#d32f2f", "#ffa000", "#2e7d32"]
-        })
-        
-        fig = px.pie(
-            df, 
-            values="Count", 
-            names="Priority",
-            title="Task Priority Distribution",
-            color="Priority",
-            color_discrete_map={
-                "High": "#d32f2f",
-                "Medium": "#ffa000",
-                "Low": "#2e7d32"
-            }
-        )
-        
-        fig.update_traces(
-            textposition='inside',
-            textinfo='percent+label',
-            hole=0.4,
-            marker=dict(line=dict(color='#ffffff', width=2))
-        )
-        
-        fig.update_layout(
-            showlegend=False,
-            margin=dict(l=20, r=20, t=40, b=20),
-            height=300
-        )
-        
-        return fig
-    return None
+    import pandas as pd
+    import plotly.express as px
+    if not high + medium + low:
+        return None
+    
+    df = pd.DataFrame({
+        "Priority": ["High", "Medium", "Low"],
+        "Count": [high, medium, low],
+        "Color": ["#d32f2f", "#ffa000", "#2e7d32"]
+    })
+    
+    fig = px.pie(
+        df, 
+        values="Count", 
+        names="Priority",
+        title="Task Priority Distribution",
+        color="Priority",
+        color_discrete_map={
+            "High": "#d32f2f",
+            "Medium": "#ffa000",
+            "Low": "#2e7d32"
+        }
+    )
+    
+    fig.update_traces(
+        textposition='inside',
+        textinfo='percent+label',
+        hole=0.4,
+        marker=dict(line=dict(color='#ffffff', width=2))
+    )
+    
+    fig.update_layout(
+        showlegend=False,
+        margin=dict(l=20, r=20, t=40, b=20),
+        height=300
+    )
+    
+    return fig
 
 def reset_database():
     """Reset the entire database"""
-    if os.path.exists(DATA_FILE):
-        os.remove(DATA_FILE)
+    with data_file() as fd:
+        os.ftruncate(fd, 0)
     st.session_state.clear()
     initialize_state()
     st.success("Database reset successfully!")
@@ -235,6 +534,9 @@ initialize_state()
 # App UI
 st.set_page_config(page_title="Advanced To-Do App", page_icon="✅", layout="wide")
 
+if st.session_state.load_error:
+    st.error(st.session_state.load_error)
+
 # Custom CSS
 st.markdown("""
 <style>
@@ -320,6 +622,7 @@ if not st.session_state.get("authenticated", False):
     if st.session_state.get("register_success", False):
         st.session_state.register_success = False
         st.session_state.auth_tab = "Login"
+        st.session_state.register_notice = True
         st.rerun()
 
     # Handle tab switch buttons
@@ -335,6 +638,8 @@ if not st.session_state.get("authenticated", False):
 
     # ----------------- LOGIN FORM -----------------
     if st.session_state.auth_tab == "Login":
+        if st.session_state.pop("register_notice", False):
+            st.success("✓ Registration successful! Please log in.")
         with st.form("login_form"):
             st.subheader("Login")
             username = st.text_input("Username", key="login_username")
@@ -382,15 +687,12 @@ if not st.session_state.get("authenticated", False):
                     st.error(error)
                 else:
                     with st.spinner('Creating your account...'):
-                        time.sleep(1.5)
                         st.session_state.users[username] = {
                             "password_hash": hash_password(password),
-                            "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                            "created_at": timestamp()
                         }
-                        save_data()
+                        mark_dirty()
 
-                    st.success("✓ Registration successful! Redirecting to login...")
-                    time.sleep(1.5)
                     st.session_state.register_success = True
                     st.rerun()
 
@@ -399,6 +701,7 @@ if not st.session_state.get("authenticated", False):
             st.session_state.switch_to_login = True
             st.rerun()
 
+    flush_data()
     st.stop()
 
 
@@ -425,16 +728,13 @@ with st.sidebar:
     
     # Display all lists
     st.subheader("Your Lists")
-    if not st.session_state.lists:
+    # Lists owned by current user
+    user_list_ids = st.session_state.owner_index[st.session_state.username]
+    if not user_list_ids:
         st.info("No lists yet. Create one to get started!")
     
-    # Filter lists owned by current user
-    user_lists = {
-        list_id: list_data for list_id, list_data in st.session_state.lists.items()
-        if list_data.get("owner") == st.session_state.username
-    }
-    
-    for list_id, list_data in user_lists.items():
+    for list_id in list(user_list_ids):
+        list_data = st.session_state.lists[list_id]
         cols = st.columns([6, 1])
         with cols[0]:
             if st.button(
@@ -512,7 +812,7 @@ if st.session_state.current_list and st.session_state.current_list in st.session
                 pass
     
     # Task list
-    if current_list_data["tasks"]:
+    if current_list_data["_total"]:
         st.divider()
         
         # Filter options
@@ -529,61 +829,48 @@ if st.session_state.current_list and st.session_state.current_list in st.session
                 key="priority_filter"
             )
         
-        filtered_tasks = [
-            task for task in current_list_data["tasks"]
-            if ((task["completed"] and st.session_state.show_completed) or 
-                (not task["completed"] and st.session_state.show_pending))
-            and (st.session_state.priority_filter == "All" or 
-                 task["priority"] == st.session_state.priority_filter)
-        ]
+        tasks = current_list_data["tasks"]
+        priority_filter = st.session_state.priority_filter
+        mask, priority_counts = get_count_and_filter()(
+            tasks["priority"],
+            tasks["completed"],
+            st.session_state.show_completed,
+            st.session_state.show_pending,
+            -1 if priority_filter == "All" else PRIORITIES.index(priority_filter)
+        )
+        rows = np.flatnonzero(mask).tolist()
         
-        if not filtered_tasks:
+        if not rows:
             st.info("No tasks match your filters")
         else:
-            for task in filtered_tasks:
-                priority_class = f"priority-{task['priority'].lower()}"
-                with st.container():
-                    cols = st.columns([1, 8, 1])
-                    with cols[0]:
-                        st.checkbox(
-                            "",
-                            value=task["completed"],
-                            on_change=toggle_task,
-                            args=(st.session_state.current_list, task["id"]),
-                            key=f"check_{task['id']}",
-                            label_visibility="collapsed"
-                        )
-                    with cols[1]:
-                        if task["completed"]:
-                            st.markdown(
-                                f"""<div class="{priority_class}">
-                                    <p class="task-completed">✅ {task['emoji']} {task['text']}
-                                    </p>
-                                    <p><small>Completed: {task.get('completed_at', 'Just now')} (Priority: {task['priority']})</small></p>
-                                </div>""",
-                                unsafe_allow_html=True
-                            )
-                        else:
-                            st.markdown(
-                                f"""<div class="{priority_class}">
-                                    <p class="task-pending">{task['emoji']} {task['text']}</p>
-                                    <p><small>Created: {task['created_at']} (Priority: {task['priority']})</small></p>
-                                </div>""",
-                                unsafe_allow_html=True
-                            )
-                    with cols[2]:
-                        st.button(
-                            "🗑️", 
-                            key=f"del_task_{task['id']}",
-                            on_click=delete_task,
-                            args=(st.session_state.current_list, task["id"]),
-                            use_container_width=True
-                        )
-                    st.divider()
+            st.markdown("".join(tasks["_cards"][i] for i in rows), unsafe_allow_html=True)
+            
+            # Task actions, applied together on submit
+            completed = tasks["completed"][rows].tolist()
+            with st.form("task_actions"):
+                st.data_editor(
+                    {
+                        "Done": completed,
+                        "Task": [f"{tasks['emoji'][i]} {tasks['texts'][i]}" for i in rows],
+                        "Delete": [False] * len(rows)
+                    },
+                    key=f"task_editor_{st.session_state.task_editor_rev}",
+                    column_config={
+                        "Done": st.column_config.CheckboxColumn("✅", width="small"),
+                        "Delete": st.column_config.CheckboxColumn("🗑️", width="small")
+                    },
+                    disabled=["Task"],
+                    hide_index=True,
+                    use_container_width=True
+                )
+                st.form_submit_button(
+                    "Apply changes",
+                    on_click=apply_task_edits,
+                    args=(st.session_state.current_list, [tasks["ids"][i] for i in rows], completed)
+                )
         
         # List statistics and actions
-        total_tasks = len(current_list_data["tasks"])
-        completed_tasks = sum(1 for task in current_list_data["tasks"] if task["completed"])
+        total_tasks, completed_tasks = get_task_count(st.session_state.current_list)
         
         cols = st.columns(4)
         with cols[0]:
@@ -597,15 +884,17 @@ if st.session_state.current_list and st.session_state.current_list in st.session
                     pass
         with cols[3]:
             if st.button("Clear All Tasks", type="primary", use_container_width=True):
-                st.session_state.lists[st.session_state.current_list]["tasks"] = []
-                save_data()
+                st.session_state.lists[st.session_state.current_list]["tasks"] = empty_tasks()
+                rebuild_task_cache(st.session_state.lists[st.session_state.current_list])
+                mark_dirty()
                 st.rerun()
         
         # Priority distribution chart
         if total_tasks > 0:
             st.divider()
             st.subheader("Task Priority Distribution")
-            chart = create_priority_chart(st.session_state.current_list)
+            low, medium, high = priority_counts.tolist()
+            chart = create_priority_chart(high, medium, low)
             if chart:
                 st.plotly_chart(chart, use_container_width=True)
     else:
@@ -614,17 +903,12 @@ else:
     st.info("No list selected or no lists available. Create a new list from the sidebar.")
 
 # Motivational quotes
-motivational_quotes = [
-    "Productivity is doing what needs to be done when it needs to be done.",
-    "Small daily improvements lead to stunning results.",
-    "The way to get started is to quit talking and begin doing.",
-    "Your time is limited, don't waste it living someone else's life.",
-    "The secret of getting ahead is getting started."
-]
-
 if st.session_state.lists:
     st.divider()
     st.markdown(
-        f'<div class="motivational-tip">💡 Motivational Tip: {random.choice(motivational_quotes)}</div>',
+        f'<div class="motivational-tip">💡 Motivational Tip: {MOTIVATIONAL_QUOTES[st.session_state.motivational_quote_idx]}</div>',
         unsafe_allow_html=True
     )
+
+# Persist any changes made during this run
+flush_data()